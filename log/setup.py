@@ -1,12 +1,28 @@
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+# File writes happen on the listener's background thread, so logging calls
+# in the ingest loops only enqueue the record.
+file_handler = logging.FileHandler("log/app.log", mode="a", encoding="utf-8")
+file_handler.setFormatter(logging.Formatter(
+    fmt="%(levelname)s: %(name)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M"
+))
+
+log_queue = queue.SimpleQueue()
+listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+listener.start()
+atexit.register(listener.stop)
+
+# the listener's handler applies the real format; keep the queued message bare
+queue_handler = QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter("%(message)s"))
 
 logging.basicConfig(
-    filename="log/app.log",
-    encoding="utf-8",
-    filemode="a",
     level=logging.INFO,
-    format="%(levelname)s: %(name)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M"
+    handlers=[queue_handler]
 )
 
 logger = logging.getLogger(__name__)
@@ -1,187 +1,158 @@
 from utils.config import logger
 from pathlib import Path
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 import argparse
-from kaggle.api.kaggle_api_extended import KaggleApi, RequestException
+import csv
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from datetime import datetime
-from utils.s3_utils import RawLayerManager
-
-def define_path(path: Path = None) -> Path:
-    """
-    Define and create an output directory.
-
-    If no path is provided, a "data" directory in the current working directory
-    is created. Otherwise, the provided path is resolved to an absolute path.
-
-    Parameters
-    ----------
-    path : pathlib.Path, optional
-        The target directory path. If None, defaults to Path.cwd() / "data".
-
-    Returns
-    -------
-    pathlib.Path
-        The resolved and created output directory.
-
-    Raises
-    ------
-    PermissionError
-        If the directory cannot be created due to permission issues.
-    OSError
-        If the directory cannot be created for any other OS-related reason.
-    """
-    if path is None:
-        path = Path.cwd() / "data"
-    else:
-        path = Path(path).resolve()
-    
-    try:
-        path.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Output directory created: {path}")
-    except PermissionError as e:
-        logger.error(f"Permission denied creating directory {path}: {e}")
-        raise
-    except OSError as e:
-        logger.error(f"Failed to create directory {path}: {e}")
-        raise
-    
-    return path
-
-
-def authenticate_kaggle_api() -> KaggleApi:
-    """
-    Authenticate and return a Kaggle API client.
-
-    This function initializes the KaggleApi object and attempts to authenticate
-    using the user's stored Kaggle credentials.
-
-    Returns
-    -------
-    KaggleApi
-        An authenticated Kaggle API client.
-
-    Raises
-    ------
-    RuntimeError
-        If authentication fails due to invalid credentials or missing configuration.
-    """
-    api = KaggleApi()
-    try:
-        api.authenticate()
-        logger.debug("Authenticated with Kaggle AP.")
-    except RequestException as e:
-        logger.error(f"Kaggle API authentication failed: {e}")
-        raise RuntimeError("Kaggle authentication failed") from e
-    
-    return api
-
-
-def get_dataset_path(
-    dataset: str = "priyamchoksi/credit-card-transactions-dataset",
-    data_path: Path = None
-) -> Path:
+from typing import Optional
+from utils.s3_utils import RawLayerManager, date_partition
+from src.extract.transactions import get_dataset_path, list_dataset_files
+
+# Rows parsed per chunk when streaming JSON files into the raw layer
+CHUNKSIZE = 500_000
+# Bytes of CSV text parsed per chunk by the multithreaded Arrow reader
+CSV_BLOCK_SIZE = 256 << 20
+# Map Arrow strings to pandas' Arrow-backed string dtype instead of object
+ARROW_STRING_TYPES = {
+    pa.string(): pd.StringDtype("pyarrow"),
+    pa.large_string(): pd.StringDtype("pyarrow"),
+}
+# Narrow types for the Kaggle transactions CSV; columns absent from a file are
+# ignored. Pinning them also keeps every block's schema identical.
+CATEGORY = pa.dictionary(pa.int32(), pa.string())
+TRANSACTIONS_COLUMN_TYPES = {
+    'trans_date_trans_time': pa.timestamp('s'),
+    'cc_num': pa.int64(),
+    'merchant': CATEGORY,
+    'category': CATEGORY,
+    'amt': pa.float64(),
+    'gender': CATEGORY,
+    'city': CATEGORY,
+    'state': CATEGORY,
+    'zip': pa.int32(),
+    'lat': pa.float64(),
+    'long': pa.float64(),
+    'city_pop': pa.int32(),
+    'job': CATEGORY,
+    'unix_time': pa.int64(),
+    'merch_lat': pa.float64(),
+    'merch_long': pa.float64(),
+    'is_fraud': pa.int8(),
+    # sparse in the source, so written as float text ("28705.0") with blanks
+    'merch_zipcode': pa.float64(),
+}
+# Column types per source. Columns without a pinned type are read as strings:
+# Arrow would otherwise infer them from the first block only, and a later
+# block that doesn't fit the inferred type fails the whole file.
+SOURCE_COLUMN_TYPES = {
+    'transactions': TRANSACTIONS_COLUMN_TYPES,
+}
+# Chunks uploaded concurrently; also caps how many parsed chunks sit in memory
+UPLOAD_WORKERS = 4
+# Dataset files ingested concurrently, each with its own UPLOAD_WORKERS chunks
+FILE_WORKERS = 4
+
+def read_csv_chunks(file: Path, column_types: Optional[dict] = None):
     """
-    Download and extract a Kaggle dataset if not already present.
+    Stream a CSV file as a sequence of DataFrames.
 
-    Checks if the target directory contains any files. If empty, downloads
-    the specified dataset from Kaggle, extracts it, and returns the path.
+    Parsing is done by Arrow's multithreaded block reader, so only one block
+    of ``CSV_BLOCK_SIZE`` bytes is held in memory at a time. String columns
+    stay Arrow-backed, so converting the chunks back to Arrow on write is
+    zero-copy.
 
     Parameters
     ----------
-    dataset : str, optional
-        The Kaggle dataset identifier in the format "username/dataset-name".
-        Defaults to "priyamchoksi/credit-card-transactions-dataset".
-    data_path : pathlib.Path, optional
-        Directory to which the dataset should be downloaded. If None,
-        defaults to the "data" directory in the current working directory.
-
-    Returns
-    -------
-    pathlib.Path
-        Path to the directory containing the dataset files.
+    file : pathlib.Path
+        Path to the CSV file to read.
+    column_types : dict, optional
+        Arrow types for known columns; every other column is read as strings.
 
-    Raises
+    Yields
     ------
-    RuntimeError
-        If the download or extraction fails.
+    pandas.DataFrame
+        One DataFrame per parsed block.
     """
-    data_path = define_path(path=data_path)
-    api = authenticate_kaggle_api()
-    
-    if any(data_path.iterdir()):
-        logger.info(f"Dataset already exists in {data_path}")
-        return data_path
-    
-    try:
-        logger.info(f"Downloading dataset '{dataset}' to {data_path}")
-        api.dataset_download_files(
-            dataset,
-            path=str(data_path),
-            unzip=True,
-            quiet=False
+    with open(file, newline='', encoding='utf-8') as f:
+        header = next(csv.reader(f), [])
+    types = {name: pa.string() for name in header}
+    types.update(column_types or {})
+    read_options = pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE, use_threads=True)
+    convert_options = pacsv.ConvertOptions(column_types=types)
+    with pacsv.open_csv(
+        file, read_options=read_options, convert_options=convert_options
+    ) as reader:
+        for batch in reader:
+            yield batch.to_pandas(types_mapper=ARROW_STRING_TYPES.get)
+
+def _ingest_part(mgr: RawLayerManager, df: pd.DataFrame, part: int, stem: str,
+                 processing_date: datetime, fmt: str, original_format: str) -> str:
+    key = mgr.ingest_data(
+        df,
+        processing_date,
+        fmt=fmt,
+        partition_cols=date_partition(processing_date),
+        metadata={'original_format':original_format},
+        part=part,
+        stem=stem
+    )
+    logger.info(f" → raw part {part} at s3://{mgr.bucket}/{key}")
+    return key
+
+def _ingest_chunks(mgr: RawLayerManager, chunks, stem: str, processing_date: datetime,
+                   fmt: str, original_format: str):
+    # keep at most UPLOAD_WORKERS chunks in flight so parsing can't outrun uploads
+    with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as ex:
+        pending = set()
+        for part, df in enumerate(chunks):
+            if len(pending) >= UPLOAD_WORKERS:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    fut.result()
+            pending.add(ex.submit(
+                _ingest_part, mgr, df, part, stem, processing_date, fmt, original_format
+            ))
+        for fut in pending:
+            fut.result()
+
+def _ingest_one(mgr: RawLayerManager, file: Path, processing_date: datetime):
+    fmt = file.suffix.lstrip('.').lower()
+    logger.info(f"Ingesting RAW {file.name} as format={fmt}")
+
+    if fmt == 'parquet':
+        # already columnar: upload the file as-is straight from disk
+        key = mgr.ingest_file(
+            str(file),
+            processing_date,
+            partition_cols=date_partition(processing_date),
+            metadata={'original_format':'parquet'}
         )
-        logger.info("Dataset downloaded successfully")
-    except Exception as e:
-        logger.error(f"Kaggle API download failed: {e}")
-        raise RuntimeError(f"Failed to download dataset {dataset}") from e
-
-    return data_path
-
-
-def list_dataset_files(data_path: Path) -> list:
-    """
-    List all files in a given directory.
-
-    Parameters
-    ----------
-    data_path : pathlib.Path
-        Path to the directory whose files will be listed.
-
-    Returns
-    -------
-    list of pathlib.Path
-        A list of file paths contained in the directory.
-    """
-    return [f for f in data_path.iterdir() if f.is_file()]
+        logger.info(f" → raw data at s3://{mgr.bucket}/{key}")
+    else:
+        # stream the file in bounded chunks; each chunk becomes one raw part.
+        # CSV is transcoded to Parquet once here so later reads skip re-parsing
+        if fmt == 'csv':
+            chunks = read_csv_chunks(file, SOURCE_COLUMN_TYPES.get(mgr.source))
+            target_fmt = 'parquet'
+        else:
+            chunks = pd.read_json(file, lines=True, chunksize=CHUNKSIZE)
+            target_fmt = fmt
+        with closing(chunks):
+            _ingest_chunks(mgr, chunks, file.stem, processing_date, target_fmt, fmt)
 
 def ingest_raw(source: str, data_dir: Path, processing_date: datetime):
     mgr = RawLayerManager(source)
+    files = list_dataset_files(data_dir)
+    if not files:
+        logger.warning(f"No dataset files found in {data_dir}")
+        return
 
-    for file in list_dataset_files(data_dir):
-        fmt = file.suffix.lstrip('.').lower()
-        logger.info(f"Ingesting RAW {file.name} as format={fmt}")
-
-        if fmt == 'parquet':
-            # upload bytes directly
-            body = file.read_bytes()
-            key = mgr.ingest_data(
-                df=pd.DataFrame(), 
-                processing_date=processing_date,
-                fmt='parquet',
-                partition_cols={
-                    'year': f"{processing_date:%Y}",
-                    'month': f"{processing_date:%m}",
-                    'day': f"{processing_date:%d}"
-                },
-                metadata={'original_format':'parquet'},
-                source_key=str(file)  # your override branch will catch this
-            )
-        else:
-            # read into pandas and let RawLayerManager._process_data + serialize
-            df = pd.read_csv(file) if fmt=='csv' else pd.read_json(file, lines=True)
-            key = mgr.ingest_data(
-                df,
-                processing_date,
-                fmt=fmt,
-                partition_cols={
-                    'year': f"{processing_date:%Y}",
-                    'month': f"{processing_date:%m}",
-                    'day': f"{processing_date:%d}"
-                },
-                metadata={'original_format':fmt}
-            )
-
-        logger.info(f" → raw data at s3://{mgr.bucket}/{key}")
+    with ThreadPoolExecutor(max_workers=min(FILE_WORKERS, len(files))) as ex:
+        list(ex.map(lambda f: _ingest_one(mgr, f, processing_date), files))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
@@ -1,7 +1,14 @@
 from utils.config import logger
 from pathlib import Path
+import os
+from concurrent.futures import ThreadPoolExecutor
+import zipfile
+from typing import Optional
 from kaggle.api.kaggle_api_extended import KaggleApi, RequestException
 
+# Dataset files fetched concurrently from Kaggle
+DOWNLOAD_WORKERS = 8
+
 def define_path(path: Path = None) -> Path:
     """
     Define and create an output directory.
@@ -72,6 +79,92 @@ def authenticate_kaggle_api() -> KaggleApi:
     return api
 
 
+def list_remote_files(api: KaggleApi, dataset: str) -> list:
+    """
+    List the names of all files in a Kaggle dataset.
+
+    Parameters
+    ----------
+    api : KaggleApi
+        An authenticated Kaggle API client.
+    dataset : str
+        The Kaggle dataset identifier in the format "username/dataset-name".
+
+    Returns
+    -------
+    list of str
+        Names of the files contained in the dataset.
+    """
+    names = []
+    page_token = None
+    while True:
+        result = api.dataset_list_files(dataset, page_token=page_token, page_size=200)
+        names.extend(f.name for f in result.files)
+        page_token = result.next_page_token
+        if not page_token:
+            return names
+
+
+def download_file(api: KaggleApi, dataset: str, name: str, data_path: Path) -> Optional[Path]:
+    """
+    Download one dataset file.
+
+    Kaggle serves large dataset files compressed, so a single-file download
+    may land as "<name>.zip" rather than the file itself.
+
+    Parameters
+    ----------
+    api : KaggleApi
+        An authenticated Kaggle API client.
+    dataset : str
+        The Kaggle dataset identifier in the format "username/dataset-name".
+    name : str
+        Name of the file within the dataset.
+    data_path : pathlib.Path
+        Directory to download into.
+
+    Returns
+    -------
+    pathlib.Path or None
+        The transport archive to extract, or None if the file landed as-is.
+        Dataset members that are themselves ZIP files are never returned.
+    """
+    api.dataset_download_file(dataset, name, path=str(data_path))
+    archive = data_path / f"{Path(name).name}.zip"
+    if name.lower().endswith(".zip") or not archive.is_file():
+        return None
+    return archive
+
+
+def extract_archives(data_path: Path, archives: list) -> None:
+    """
+    Unzip and remove the given ZIP archives.
+
+    Every member is checked before anything is written, so an archive with
+    absolute or ".." paths cannot write outside ``data_path``.
+
+    Parameters
+    ----------
+    data_path : pathlib.Path
+        Directory to extract into.
+    archives : list of pathlib.Path
+        Transport archives downloaded by this run.
+
+    Raises
+    ------
+    ValueError
+        If an archive member would be extracted outside ``data_path``.
+    """
+    root = data_path.resolve()
+    for archive in archives:
+        with zipfile.ZipFile(archive) as zf:
+            for member in zf.namelist():
+                if not (root / member).resolve().is_relative_to(root):
+                    raise ValueError(f"Unsafe path {member!r} in {archive.name}")
+            zf.extractall(root)
+        archive.unlink()
+
+
 def get_dataset_path(
     dataset: str = "priyamchoksi/credit-card-transactions-dataset",
     data_path: Path = None
@@ -80,7 +173,8 @@ def get_dataset_path(
     Download and extract a Kaggle dataset if not already present.
 
     Checks if the target directory contains any files. If empty, downloads
-    the specified dataset from Kaggle, extracts it, and returns the path.
+    each file of the specified dataset from Kaggle concurrently, extracts
+    them, and returns the path.
 
     Parameters
     ----------
@@ -104,18 +198,23 @@ def get_dataset_path(
     data_path = define_path(path=data_path)
     api = authenticate_kaggle_api()
     
-    if any(data_path.iterdir()):
+    with os.scandir(data_path) as it:
+        has_files = next(it, None) is not None
+    if has_files:
         logger.info(f"Dataset already exists in {data_path}")
         return data_path
     
     try:
-        logger.info(f"Downloading dataset '{dataset}' to {data_path}")
-        api.dataset_download_files(
-            dataset,
-            path=str(data_path),
-            unzip=True,
-            quiet=False
-        )
+        files = list_remote_files(api, dataset)
+        logger.info(f"Downloading {len(files)} files of dataset '{dataset}' to {data_path}")
+        with ThreadPoolExecutor(max_workers=max(1, min(DOWNLOAD_WORKERS, len(files)))) as ex:
+            archives = [
+                archive for archive in ex.map(
+                    lambda name: download_file(api, dataset, name, data_path), files
+                )
+                if archive is not None
+            ]
+        extract_archives(data_path, archives)
         logger.info("Dataset downloaded successfully")
     except Exception as e:
         logger.error(f"Kaggle API download failed: {e}")
@@ -138,4 +237,5 @@ def list_dataset_files(data_path: Path) -> list:
     list of pathlib.Path
         A list of file paths contained in the directory.
     """
-    return [f for f in data_path.iterdir() if f.is_file()]
+    with os.scandir(data_path) as it:
+        return [Path(e.path) for e in it if e.is_file()]
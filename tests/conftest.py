@@ -0,0 +1,5 @@
+import os
+
+# kaggle authenticates on import; src.bronze pulls it in via src.extract
+os.environ.setdefault('KAGGLE_USERNAME', 'test')
+os.environ.setdefault('KAGGLE_KEY', 'test')
@@ -0,0 +1,44 @@
+import pandas as pd
+
+import src.bronze.transactions as transactions
+from src.bronze.transactions import SOURCE_COLUMN_TYPES, read_csv_chunks
+
+CSV = (
+    "trans_date_trans_time,cc_num,amt,category,zip,is_fraud,merch_zipcode,trans_num\n"
+    "2019-01-01 00:00:18,2703186189652095,107.23,misc_net,28654,0,28705.0,0b242abb\n"
+    "2019-01-01 00:00:44,630423337322,123456.78,grocery_pos,99160,1,,1f76529f\n"
+)
+
+
+def test_read_csv_chunks_applies_pinned_types(tmp_path):
+    path = tmp_path / 'transactions.csv'
+    path.write_text(CSV)
+
+    df = next(read_csv_chunks(path, SOURCE_COLUMN_TYPES['transactions']))
+
+    assert df['amt'].tolist() == [107.23, 123456.78]
+    assert df['merch_zipcode'].iloc[0] == 28705.0
+    assert df['merch_zipcode'].isna().iloc[1]
+    assert df['is_fraud'].dtype == 'int8'
+    assert df['category'].dtype == 'category'
+    assert df['trans_num'].dtype == pd.StringDtype('pyarrow')
+
+
+def test_read_csv_chunks_reads_unpinned_columns_as_strings(tmp_path):
+    path = tmp_path / 'other.csv'
+    path.write_text("zip,state\n01234,NY\n")
+
+    df = next(read_csv_chunks(path))
+
+    assert df['zip'].tolist() == ['01234']
+    assert df['state'].dtype == pd.StringDtype('pyarrow')
+
+
+def test_read_csv_chunks_unpinned_column_survives_later_blocks(tmp_path, monkeypatch):
+    monkeypatch.setattr(transactions, 'CSV_BLOCK_SIZE', 16)
+    path = tmp_path / 'other.csv'
+    path.write_text("code\n" + "1\n" * 20 + "A7\n")
+
+    codes = pd.concat(read_csv_chunks(path))['code']
+
+    assert codes.iloc[-1] == 'A7'
@@ -0,0 +1,51 @@
+import zipfile
+
+import pytest
+
+from src.extract.transactions import download_file, extract_archives
+
+
+class FakeApi:
+    """Writes what Kaggle would: the file itself, or it wrapped in "<name>.zip"."""
+    def __init__(self, zipped):
+        self.zipped = zipped
+
+    def dataset_download_file(self, dataset, name, path):
+        if self.zipped:
+            with zipfile.ZipFile(f"{path}/{name}.zip", 'w') as zf:
+                zf.writestr(name, "a,b\n1,2\n")
+        else:
+            with open(f"{path}/{name}", 'w') as f:
+                f.write("a,b\n1,2\n")
+
+
+def test_download_file_returns_transport_archive(tmp_path):
+    archive = download_file(FakeApi(zipped=True), 'o/d', 'cards.csv', tmp_path)
+
+    assert archive == tmp_path / 'cards.csv.zip'
+
+
+def test_download_file_returns_none_for_plain_files(tmp_path):
+    assert download_file(FakeApi(zipped=False), 'o/d', 'cards.csv', tmp_path) is None
+
+
+def test_extract_archives_only_touches_given_archives(tmp_path):
+    with zipfile.ZipFile(tmp_path / 'cards.csv.zip', 'w') as zf:
+        zf.writestr('cards.csv', "a,b\n1,2\n")
+    with zipfile.ZipFile(tmp_path / 'member.zip', 'w') as zf:
+        zf.writestr('inner.csv', "x\n")
+
+    extract_archives(tmp_path, [tmp_path / 'cards.csv.zip'])
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['cards.csv', 'member.zip']
+
+
+def test_extract_archives_rejects_paths_outside_data_dir(tmp_path):
+    data = tmp_path / 'data'
+    data.mkdir()
+    with zipfile.ZipFile(data / 'evil.zip', 'w') as zf:
+        zf.writestr('../escape.csv', "x\n")
+
+    with pytest.raises(ValueError):
+        extract_archives(data, [data / 'evil.zip'])
+    assert not (tmp_path / 'escape.csv').exists()
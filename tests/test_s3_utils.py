@@ -0,0 +1,273 @@
+from datetime import datetime
+
+import boto3
+import pandas as pd
+import pyarrow as pa
+import pyarrow.fs as pafs
+import pytest
+from boto3.s3.transfer import TransferConfig
+from botocore.stub import ANY, Stubber
+
+import utils.s3_utils as s3_utils
+from utils.s3_utils import BronzeLayerManager, DataQualityError, RawLayerManager, date_partition
+
+PROCESSING_DATE = datetime(2024, 3, 7, 9, 5, 1)
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    client = boto3.client(
+        's3', region_name='us-east-1',
+        aws_access_key_id='test', aws_secret_access_key='test'
+    )
+    monkeypatch.setattr(s3_utils, 'get_s3_client', lambda: client)
+    with Stubber(client) as stubber:
+        yield stubber
+        stubber.assert_no_pending_responses()
+
+
+@pytest.fixture
+def local_lake(monkeypatch, tmp_path):
+    """Serve bucket reads from tmp_path instead of S3"""
+    fs = pafs.SubTreeFileSystem(str(tmp_path), pafs.LocalFileSystem())
+    monkeypatch.setattr(s3_utils, 'get_s3_filesystem', lambda: fs)
+    monkeypatch.setattr(
+        s3_utils.DataLakeManager, '_get_object_body',
+        lambda self, key: (tmp_path / self.bucket / key).read_bytes()
+    )
+    return tmp_path
+
+
+def test_date_partition():
+    assert date_partition(PROCESSING_DATE) == {'year': '2024', 'month': '03', 'day': '07'}
+
+
+def test_generate_key_with_partitions_part_and_stem():
+    mgr = RawLayerManager('transactions')
+    key = mgr._generate_key(
+        'parquet', PROCESSING_DATE, date_partition(PROCESSING_DATE), part=3, stem='cards'
+    )
+    assert key == (
+        'raw/transactions/year=2024/month=03/day=07/'
+        'transactions_cards_20240307_090501_part00003.parquet'
+    )
+
+
+def test_generate_key_stems_keep_files_apart():
+    mgr = RawLayerManager('transactions')
+    keys = {mgr._generate_key('parquet', PROCESSING_DATE, part=0, stem=stem)
+            for stem in ('train', 'test')}
+    assert len(keys) == 2
+
+
+def test_generate_key_without_partitions():
+    mgr = RawLayerManager('transactions')
+    assert mgr._generate_key('csv.gz', PROCESSING_DATE) == (
+        'raw/transactions/transactions_20240307_090501.csv.gz'
+    )
+
+
+@pytest.mark.parametrize('fmt', ['parquet', 'arrow', 'csv', 'json'])
+def test_serialize_read_round_trip(local_lake, fmt):
+    mgr = BronzeLayerManager('transactions')
+    df = pd.DataFrame({'cc_num': [1, 2, 3], 'amt': [107.23, 123456.78, 0.5],
+                       'category': ['food', 'gas', 'food']})
+    sink = pa.BufferOutputStream()
+    mgr._serialize_data(df, sink, fmt)
+    key = f"bronze/transactions/part.{fmt}" + ('.gz' if fmt in s3_utils.GZIP_FORMATS else '')
+    path = local_lake / mgr.bucket / key
+    path.parent.mkdir(parents=True)
+    path.write_bytes(sink.getvalue().to_pybytes())
+
+    table = mgr._read_object(key, fmt, columns=None, filters=None, sql=None)
+
+    pd.testing.assert_frame_equal(table.to_pandas(), df)
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'json'])
+def test_ingest_data_stores_text_formats_as_plain_gzip_files(s3, fmt):
+    mgr = BronzeLayerManager('transactions')
+    s3.add_response('put_object', {}, {
+        'Bucket': mgr.bucket, 'Key': ANY, 'Body': ANY, 'IfNoneMatch': '*',
+        'Metadata': ANY, 'ContentType': 'application/gzip',
+    })
+
+    key = mgr.ingest_data(pd.DataFrame({'amt': [1.5]}), PROCESSING_DATE, fmt=fmt)
+
+    assert key.endswith(f".{fmt}.gz")
+
+
+def test_select_rejects_arrow():
+    with pytest.raises(ValueError):
+        BronzeLayerManager('transactions')._select('key.arrow', 'arrow', 'SELECT * FROM S3Object')
+
+
+def test_load_rejects_sql_on_arrow_before_listing(s3):
+    with pytest.raises(ValueError):
+        BronzeLayerManager('transactions').load_from_previous_layer(
+            PROCESSING_DATE, fmt='arrow', sql='SELECT * FROM S3Object'
+        )
+
+
+def test_narrow_dtypes_uses_declared_widths_whatever_the_values():
+    mgr = BronzeLayerManager('transactions', narrow_dtypes=True)
+    small = mgr._process_data(pd.DataFrame({'zip': [1, 2], 'amt': [1.5, 2.5]}))
+    large = mgr._process_data(pd.DataFrame({'zip': [99160, None], 'amt': [1.5, 2.5]}))
+
+    assert small['zip'].dtype == large['zip'].dtype == 'Int32'
+    assert small['amt'].dtype == 'float64'
+
+
+def test_narrow_dtypes_rejects_values_outside_the_declared_width():
+    mgr = BronzeLayerManager('transactions', narrow_dtypes=True)
+    with pytest.raises(DataQualityError):
+        mgr._process_data(pd.DataFrame({'is_fraud': [0, 300]}))
+
+
+def test_raw_ingest_copies_small_source_with_copy_object(s3):
+    mgr = RawLayerManager('transactions')
+    s3.add_response('head_object', {'ContentLength': 10},
+                    {'Bucket': mgr.bucket, 'Key': 'landing/cards.parquet'})
+    s3.add_response('copy_object', {}, {
+        'Bucket': mgr.bucket, 'Key': ANY, 'Metadata': ANY, 'MetadataDirective': 'REPLACE',
+        'CopySource': {'Bucket': mgr.bucket, 'Key': 'landing/cards.parquet'},
+    })
+
+    key = mgr.ingest_data(pd.DataFrame(), PROCESSING_DATE, fmt='parquet',
+                          source_key='landing/cards.parquet', stem='cards')
+
+    assert key == 'raw/transactions/transactions_cards_20240307_090501.parquet'
+
+
+def test_raw_ingest_copies_large_source_with_multipart_copy(s3, monkeypatch):
+    mgr = RawLayerManager('transactions')
+    monkeypatch.setattr(s3_utils, 'COPY_OBJECT_MAX_SIZE', 5)
+    monkeypatch.setattr(s3_utils, 'TRANSFER_CONFIG', TransferConfig(
+        multipart_threshold=1, multipart_chunksize=1024, use_threads=False
+    ))
+    for _ in range(2):  # ours, then the managed copy's own size lookup
+        s3.add_response('head_object', {'ContentLength': 10}, {
+            'Bucket': mgr.bucket, 'Key': 'landing/cards.parquet',
+        })
+    s3.add_response('create_multipart_upload', {'UploadId': 'u'}, {
+        'Bucket': mgr.bucket, 'Key': ANY, 'Metadata': ANY,
+    })
+    s3.add_response('upload_part_copy', {'CopyPartResult': {'ETag': '"e"'}}, {
+        'Bucket': mgr.bucket, 'Key': ANY, 'UploadId': 'u', 'PartNumber': 1,
+        'CopySource': ANY, 'CopySourceRange': ANY,
+    })
+    s3.add_response('complete_multipart_upload', {}, {
+        'Bucket': mgr.bucket, 'Key': ANY, 'UploadId': 'u', 'MultipartUpload': ANY,
+    })
+
+    mgr.ingest_data(pd.DataFrame(), PROCESSING_DATE, fmt='parquet',
+                    source_key='landing/cards.parquet')
+
+
+def test_raw_ingest_copy_of_missing_source_raises(s3):
+    mgr = RawLayerManager('transactions')
+    s3.add_client_error('head_object', service_error_code='404', http_status_code=404)
+
+    with pytest.raises(FileNotFoundError):
+        mgr.ingest_data(pd.DataFrame(), PROCESSING_DATE, fmt='parquet',
+                        source_key='landing/cards.parquet')
+
+
+def test_fingerprint_hashes_nested_object_columns():
+    mgr = BronzeLayerManager('transactions')
+    df = pd.DataFrame({'id': [1, 2], 'payload': [{'a': 1}, [1, 2]]})
+
+    fingerprint = mgr._fingerprint(df, 'json')
+
+    assert fingerprint == mgr._fingerprint(df.copy(), 'json')
+    assert fingerprint != mgr._fingerprint(df.assign(payload=[{'a': 2}, [1, 2]]), 'json')
+
+
+def test_put_if_absent_uploads_with_conditional_put(s3):
+    mgr = BronzeLayerManager('transactions')
+    s3.add_response('put_object', {}, {
+        'Bucket': mgr.bucket, 'Key': 'k', 'Body': ANY,
+        'IfNoneMatch': '*', 'Metadata': {'rows': '1'},
+    })
+
+    assert mgr._put_if_absent(pa.py_buffer(b'data'), 'k', {'Metadata': {'rows': '1'}})
+
+
+def test_put_if_absent_returns_false_when_key_exists(s3):
+    mgr = BronzeLayerManager('transactions')
+    s3.add_client_error('put_object', service_error_code='PreconditionFailed', http_status_code=412)
+
+    assert not mgr._put_if_absent(pa.py_buffer(b'data'), 'k', {'Metadata': {}})
+
+
+@pytest.fixture
+def multipart(monkeypatch):
+    monkeypatch.setattr(s3_utils, 'TRANSFER_CONFIG', TransferConfig(
+        multipart_threshold=1, multipart_chunksize=3, max_concurrency=1
+    ))
+
+
+def _stub_parts(s3, mgr):
+    s3.add_response('create_multipart_upload', {'UploadId': 'u'}, {
+        'Bucket': mgr.bucket, 'Key': 'k', 'Metadata': {}, 'ChecksumAlgorithm': 'CRC32',
+    })
+    for number, etag in ((1, '"e1"'), (2, '"e2"')):
+        s3.add_response('upload_part', {'ETag': etag, 'ChecksumCRC32': 'c'}, {
+            'Bucket': mgr.bucket, 'Key': 'k', 'UploadId': 'u', 'PartNumber': number,
+            'Body': ANY, 'ChecksumAlgorithm': 'CRC32',
+        })
+    return {'Bucket': mgr.bucket, 'Key': 'k', 'UploadId': 'u', 'IfNoneMatch': '*',
+            'MultipartUpload': {'Parts': [
+                {'PartNumber': 1, 'ETag': '"e1"', 'ChecksumCRC32': 'c'},
+                {'PartNumber': 2, 'ETag': '"e2"', 'ChecksumCRC32': 'c'},
+            ]}}
+
+
+def test_put_if_absent_multipart_completes_conditionally(s3, multipart):
+    mgr = BronzeLayerManager('transactions')
+    s3.add_response('complete_multipart_upload', {}, _stub_parts(s3, mgr))
+
+    assert mgr._put_if_absent(pa.py_buffer(b'data'), 'k', {'Metadata': {}})
+
+
+def test_put_if_absent_multipart_aborts_when_key_exists(s3, multipart):
+    mgr = BronzeLayerManager('transactions')
+    s3.add_client_error(
+        'complete_multipart_upload', service_error_code='PreconditionFailed',
+        http_status_code=412, expected_params=_stub_parts(s3, mgr)
+    )
+    s3.add_response('abort_multipart_upload', {},
+                    {'Bucket': mgr.bucket, 'Key': 'k', 'UploadId': 'u'})
+
+    assert not mgr._put_if_absent(pa.py_buffer(b'data'), 'k', {'Metadata': {}})
+
+
+def test_ingest_data_writes_one_object_without_dedup(s3):
+    mgr = BronzeLayerManager('transactions')
+    s3.add_response('put_object', {}, {
+        'Bucket': mgr.bucket, 'Key': ANY, 'Body': ANY, 'IfNoneMatch': '*', 'Metadata': ANY,
+    })
+
+    key = mgr.ingest_data(
+        pd.DataFrame({'amt': [1.5]}), PROCESSING_DATE,
+        partition_cols=date_partition(PROCESSING_DATE)
+    )
+
+    assert key.startswith('bronze/transactions/year=2024/month=03/day=07/')
+
+
+def test_ingest_data_dedup_sentinel_is_scoped_to_the_partition(s3):
+    mgr = BronzeLayerManager('transactions')
+    mgr.dedup_content = True
+    df = pd.DataFrame({'amt': [1.5]})
+    sentinel = f"_fingerprints/bronze/transactions/year=2024/month=03/day=07/{mgr._fingerprint(df, 'parquet')}"
+    s3.add_client_error('head_object', service_error_code='404', http_status_code=404,
+                        expected_params={'Bucket': mgr.bucket, 'Key': sentinel})
+    s3.add_response('put_object', {}, {
+        'Bucket': mgr.bucket, 'Key': ANY, 'Body': ANY, 'IfNoneMatch': '*', 'Metadata': ANY,
+    })
+    s3.add_response('put_object', {}, {
+        'Bucket': mgr.bucket, 'Key': sentinel, 'Body': b'', 'Metadata': {'key': ANY},
+    })
+
+    mgr.ingest_data(df, PROCESSING_DATE, partition_cols=date_partition(PROCESSING_DATE))
@@ -2,10 +2,25 @@ from dotenv import load_dotenv
 from log.setup import logger
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 load_dotenv()
 
-session = requests.session()
+session = requests.Session()
+adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True
+    )
+)
+session.mount("https://", adapter)
+session.mount("http://", adapter)
+session.headers["Connection"] = "keep-alive"
 
 logger = logger
 
@@ -1,33 +1,137 @@
 import os
+import gzip
 import hashlib
-from io import BytesIO
 from datetime import datetime, timedelta
 import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from threading import Lock
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import ClientError
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.fs as pafs
+import pyarrow.json as pajson
 import pyarrow.parquet as pq
 from typing import Optional, Dict, List, Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from utils.config import logger
 
+S3_MAX_CONCURRENCY = int(os.getenv('S3_MAX_CONCURRENCY', 32))
+
 S3_CONFIG = Config(
     retries={
         'max_attempts': int(os.getenv('AWS_MAX_ATTEMPTS', 10)),
         'mode': os.getenv('AWS_RETRY_MODE', 'standard')
     },
-    max_pool_connections=int(os.getenv('AWS_MAX_POOL_CONNECTIONS', 100))
+    # never fewer pooled connections than one transfer's concurrent parts
+    max_pool_connections=max(
+        int(os.getenv('AWS_MAX_POOL_CONNECTIONS', 100)), S3_MAX_CONCURRENCY
+    ),
+    tcp_keepalive=os.getenv('AWS_TCP_KEEPALIVE', 'true').lower() == 'true'
 )
 
-SESSION = boto3.Session(
-    aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-    aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-    region_name=os.getenv('AWS_REGION', 'us-east-1')
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=int(os.getenv('S3_MULTIPART_THRESHOLD', 8 * 1024 * 1024)),
+    multipart_chunksize=int(os.getenv('S3_MULTIPART_CHUNKSIZE', 16 * 1024 * 1024)),
+    max_concurrency=S3_MAX_CONCURRENCY,
+    use_threads=True
 )
 
-s3_client = SESSION.client('s3', config=S3_CONFIG)
+PARQUET_WRITE_OPTIONS = {
+    'compression': os.getenv('PARQUET_COMPRESSION', 'zstd'),
+    'compression_level': int(os.getenv('PARQUET_COMPRESSION_LEVEL', 3)),
+    'use_dictionary': True,
+    'data_page_size': 1 << 20,
+    # row-group min/max stats let load_from_previous_layer's filters skip data
+    'write_statistics': True,
+}
+
+# Formats serialized from an Arrow table rather than directly from pandas
+ARROW_FORMATS = ('parquet', 'arrow', 'csv')
+
+# Formats S3 Select can query (Arrow IPC is not one of them)
+SELECT_FORMATS = ('parquet', 'json', 'csv')
+
+CSV_WRITE_OPTIONS = pacsv.WriteOptions(include_header=True, batch_size=65536)
+
+# Text formats gzip-compressed before upload. They are stored as plain
+# ".gz" files (Content-Type application/gzip, no Content-Encoding), so HTTP
+# clients never transparently decode them. Level 1 compresses faster than
+# the upload it shrinks.
+GZIP_FORMATS = {'csv', 'json'}
+GZIP_LEVEL = int(os.getenv('GZIP_LEVEL', 1))
+
+# Largest object a single CopyObject call may copy
+COPY_OBJECT_MAX_SIZE = 5 * 1024 ** 3
+
+# Hash for content fingerprints/checksums; SHA-256 runs on CPU SHA extensions
+CHECKSUM_ALGO = 'sha256'
+
+# opt-in: skip frames whose content is already stored in the same partition;
+# costs a sentinel HEAD and PUT per ingest
+DEDUP_CONTENT = os.getenv('DEDUP_CONTENT', 'false').lower() == 'true'
+
+# Objects fetched concurrently when loading the previous layer
+LOAD_WORKERS = int(os.getenv('S3_LOAD_WORKERS', 32))
+
+# Prefix shards listed concurrently, and the partition levels
+# (year=/month=/day=) searched for them
+LIST_WORKERS = int(os.getenv('S3_LIST_WORKERS', 32))
+LIST_SHARD_DEPTH = 3
+
+# opt-in integer narrowing on bronze ingest, to fixed widths declared per
+# source so every object of a source keeps one schema; nullable dtypes so
+# parts with and without missing values match
+NARROW_DTYPES = os.getenv('NARROW_DTYPES', 'false').lower() == 'true'
+NARROW_COLUMN_TYPES: Dict[str, Dict[str, str]] = {
+    'transactions': {
+        'zip': 'Int32',
+        'city_pop': 'Int32',
+        'is_fraud': 'Int8',
+    },
+}
+
+# sources processed concurrently by process_layers; each one is I/O bound
+SOURCE_WORKERS = int(os.getenv('SOURCE_WORKERS', 4))
+
+# prefix listings from objects_exist kept to answer later existence checks,
+# and for how many seconds; S3 is only consistent for a fresh LIST
+LISTING_CACHE_SIZE = int(os.getenv('S3_LISTING_CACHE_SIZE', 64))
+LISTING_TTL = float(os.getenv('S3_LISTING_TTL', 30))
+
+# Clients are built on first use, so importing this module (e.g. for
+# date_partition) does not pay for credential resolution or connection setup.
+@lru_cache(maxsize=1)
+def get_s3_client():
+    """Process-wide boto3 S3 client"""
+    session = boto3.Session(
+        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+        region_name=os.getenv('AWS_REGION', 'us-east-1')
+    )
+    return session.client('s3', config=S3_CONFIG)
+
+@lru_cache(maxsize=1)
+def get_list_paginator():
+    """Process-wide list_objects_v2 paginator"""
+    return get_s3_client().get_paginator('list_objects_v2')
+
+@lru_cache(maxsize=1)
+def get_s3_filesystem() -> pafs.S3FileSystem:
+    """Process-wide Arrow S3 filesystem"""
+    return pafs.S3FileSystem(
+        access_key=os.getenv('AWS_ACCESS_KEY_ID'),
+        secret_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+        region=os.getenv('AWS_REGION', 'us-east-1')
+    )
+
 DEFAULT_BUCKET = os.getenv('S3_BUCKET', 'credit-card-transactions-project')
 
 @dataclass
@@ -39,24 +143,89 @@ class DataLakeLayer:
 class DataQualityError(Exception):
     """Custom exception for data quality issues"""
 
+def date_partition(processing_date: datetime) -> Dict[str, str]:
+    """Hive-style year/month/day partition columns for a processing date"""
+    return {
+        'year': f"{processing_date.year:04d}",
+        'month': f"{processing_date.month:02d}",
+        'day': f"{processing_date.day:02d}",
+    }
+
+def _narrow_dtypes(df: pd.DataFrame, column_types: Dict[str, str]) -> pd.DataFrame:
+    """Cast integer columns to their declared narrow types.
+
+    Widths come from ``column_types``, never from a frame's values, so parts
+    and dates agree on the schema. Values that don't fit raise instead of
+    wrapping. Floats are left alone: float32 keeps ~7 significant digits,
+    too few for transaction amounts.
+    """
+    casts = {}
+    for col, dtype in column_types.items():
+        if col not in df.columns:
+            continue
+        info = np.iinfo(dtype.lower())
+        values = df[col]
+        if values.min() < info.min or values.max() > info.max:
+            raise DataQualityError(f"Column {col} has values outside {dtype}")
+        casts[col] = dtype
+    if not casts:
+        return df
+    before = df.memory_usage(deep=True).sum()
+    narrowed = df.astype(casts)
+    after = narrowed.memory_usage(deep=True).sum()
+    logger.info(f"Narrowed integer dtypes: {before:,} -> {after:,} bytes")
+    return narrowed
+
 class DataLakeManager:
     """Base class for data lake operations"""
-    def __init__(self, source: str, layer: str, bucket: str = DEFAULT_BUCKET):
+    def __init__(
+        self, source: str, layer: str, bucket: str = DEFAULT_BUCKET,
+        dedup_content: bool = DEDUP_CONTENT
+    ):
         self.source = source
         self.layer = layer
         self.bucket = bucket
-        self.s3 = s3_client
+        self.dedup_content = dedup_content
+        # prefix -> (expiry on the monotonic clock, keys listed under it)
+        self._listings: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._listings_lock = Lock()
+
+    @property
+    def s3(self):
+        return get_s3_client()
+
+    @property
+    def fs(self) -> pafs.S3FileSystem:
+        return get_s3_filesystem()
+
+    @property
+    def list_paginator(self):
+        return get_list_paginator()
 
     def _generate_key(
         self, fmt: str, processing_date: datetime,
-        partition_cols: Optional[Dict[str, str]] = None
+        partition_cols: Optional[Dict[str, str]] = None,
+        part: Optional[int] = None,
+        stem: Optional[str] = None
     ) -> str:
-        """Generate S3 key with Hive-style partitioning"""
+        """Generate S3 key with Hive-style partitioning.
+
+        ``stem`` (the source file name) keeps parts of different files
+        ingested for the same source and date from colliding.
+        """
         base_path = f"{self.layer}/{self.source}/"
+        ts = processing_date
+        name = f"{self.source}_{stem}" if stem else self.source
+        file_name = (
+            f"{name}_{ts.year:04d}{ts.month:02d}{ts.day:02d}"
+            f"_{ts.hour:02d}{ts.minute:02d}{ts.second:02d}"
+        )
+        if part is not None:
+            file_name = f"{file_name}_part{part:05d}"
         if partition_cols:
             partition_path = "/".join(f"{k}={v}" for k, v in partition_cols.items())
-            return f"{base_path}{partition_path}/{self.source}_{processing_date:%Y%m%d_%H%M%S}.{fmt}"
-        return f"{base_path}{self.source}_{processing_date:%Y%m%d_%H%M%S}.{fmt}"
+            return f"{base_path}{partition_path}/{file_name}.{fmt}"
+        return f"{base_path}{file_name}.{fmt}"
 
     def _validate_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """No-op validation at base"""
@@ -66,50 +235,88 @@ class DataLakeManager:
         """Data processing to be implemented by subclasses"""
         raise NotImplementedError
 
-    def _compute_checksum(self, df: pd.DataFrame, fmt: str) -> str:
-        """Compute MD5 checksum of serialized DataFrame"""
-        buf = BytesIO()
-        self._serialize_data(df, buf, fmt)
-        buf.seek(0)
-        return hashlib.md5(buf.read()).hexdigest()
+    def _to_arrow(self, df: pd.DataFrame) -> pa.Table:
+        """Convert DataFrame to Arrow on Arrow's own thread pool"""
+        return pa.Table.from_pandas(df, preserve_index=False)
 
     def _serialize_data(
-        self, df: pd.DataFrame, buf: BytesIO, fmt: str
+        self, df: pd.DataFrame, sink: pa.NativeFile, fmt: str
     ):
         """Serialize DataFrame to different formats"""
         fmt = fmt.lower()
+        if fmt == 'json':
+            # newline-delimited records via pandas' C encoder
+            with self._gzip_writer(sink) as gz:
+                df.to_json(gz, orient='records', lines=True, date_format='iso')
+            return
+        if fmt not in ARROW_FORMATS:
+            raise ValueError(f"Unsupported format: {fmt}")
+        # one DataFrame -> Arrow conversion, shared by every Arrow-based writer
+        table = self._to_arrow(df)
         if fmt == 'parquet':
-            pq.write_table(pa.Table.from_pandas(df, preserve_index=False), buf)
-        elif fmt == 'csv':
-            df.to_csv(buf, index=False)
+            pq.write_table(table, sink, **PARQUET_WRITE_OPTIONS)
+        elif fmt == 'arrow':
+            # Arrow IPC stream: near-memcpy encode, no Parquet encoding/compression
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
         else:
-            raise ValueError(f"Unsupported format: {fmt}")
+            with self._gzip_writer(sink) as gz:
+                pacsv.write_csv(table, gz, write_options=CSV_WRITE_OPTIONS)
+
+    @staticmethod
+    def _gzip_writer(sink: pa.NativeFile) -> gzip.GzipFile:
+        """Gzip stream over sink; mtime=0 keeps the output byte-for-byte reproducible"""
+        return gzip.GzipFile(fileobj=sink, mode='wb', compresslevel=GZIP_LEVEL, mtime=0)
 
     def load_from_previous_layer(
-        self, processing_date: datetime, fmt: str = 'parquet'
+        self, processing_date: datetime, fmt: str = 'parquet',
+        columns: Optional[List[str]] = None,
+        filters: Optional[List] = None,
+        sub_prefixes: Optional[List[str]] = None,
+        sql: Optional[str] = None
     ) -> pd.DataFrame:
-        """Load data from previous layer with format consideration."""
+        """Load data from previous layer with format consideration.
+
+        ``columns`` is applied to every format; ``filters`` (pyarrow DNF
+        predicates) only to Parquet, where both are pushed down so only the
+        needed column chunks and row groups are fetched from S3.
+        ``sub_prefixes`` (e.g. ``["year=2024/month=01/"]``) shards the key
+        listing so the shards are paginated concurrently. ``sql`` runs an
+        S3 Select query (e.g. ``"SELECT s.amt FROM S3Object s WHERE
+        s.is_fraud = '1'"``) against each object so only matching rows
+        leave S3; ``columns`` and ``filters`` are ignored when it is set.
+        """
         prev = {
             DataLakeLayer.BRONZE: DataLakeLayer.RAW,
             DataLakeLayer.SILVER: DataLakeLayer.BRONZE
         }[self.layer]
         prefix = f"{prev}/{self.source}/"
+        if sql and fmt not in SELECT_FORMATS:
+            raise ValueError(f"S3 Select does not support format: {fmt}")
 
         try:
-            resp = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=prefix)
-            if 'Contents' not in resp:
+            keys = [
+                k for k in self._list_keys(prefix, sub_prefixes)
+                if k.endswith((f".{fmt}", f".{fmt}.gz"))
+            ]
+            if not keys:
                 return pd.DataFrame()
 
-            frames = []
-            for obj in resp['Contents']:
-                if not obj['Key'].endswith(f".{fmt}"):
-                    continue
-                body = self.s3.get_object(Bucket=self.bucket, Key=obj['Key'])['Body'].read()
-                if fmt == 'parquet':
-                    frames.append(pd.read_parquet(BytesIO(body)))
-                elif fmt == 'csv':
-                    frames.append(pd.read_csv(BytesIO(body)))
-            return pd.concat(frames) if frames else pd.DataFrame()
+            with ThreadPoolExecutor(max_workers=min(LOAD_WORKERS, len(keys))) as ex:
+                tables = [
+                    table for table in ex.map(
+                        lambda key: self._read_object(key, fmt, columns, filters, sql),
+                        keys
+                    )
+                    if table is not None
+                ]
+            if not tables:
+                return pd.DataFrame()
+            # one Arrow concat, then a single hand-off to pandas that frees
+            # Arrow buffers as they are converted
+            combined = pa.concat_tables(tables, promote_options='permissive')
+            del tables
+            return combined.to_pandas(split_blocks=True, self_destruct=True)
 
         except ClientError as e:
             logger.error(f"Error loading from {prev}: {e}")
@@ -119,7 +326,9 @@ class DataLakeManager:
         self, df: pd.DataFrame, processing_date: datetime,
         fmt: str = 'parquet',
         partition_cols: Optional[Dict[str, str]] = None,
-        metadata: Optional[Dict[str, str]] = None
+        metadata: Optional[Dict[str, str]] = None,
+        part: Optional[int] = None,
+        stem: Optional[str] = None
     ) -> str:
         """Ingest processed data to target layer"""
         if df.empty:
@@ -127,30 +336,336 @@ class DataLakeManager:
             return ""
         validated = self._validate_data(df)
         processed = self._process_data(validated)
-        key = self._generate_key(fmt, processing_date, partition_cols)
-        if self._object_exists(key):
-            logger.info(f"Skipping existing object {key}")
-            return key
-        buf = BytesIO()
-        self._serialize_data(processed, buf, fmt)
-        buf.seek(0)
-        checksum = self._compute_checksum(processed, fmt)
+        ext = f"{fmt}.gz" if fmt.lower() in GZIP_FORMATS else fmt
+        key = self._generate_key(ext, processing_date, partition_cols, part, stem)
+        fingerprint = self._fingerprint(processed, fmt)
+        if self.dedup_content:
+            existing = self._fingerprint_target(key, fingerprint)
+            if existing:
+                logger.info(f"Skipping duplicate content already stored at {existing}")
+                return existing
+        # native Arrow buffer: writers fill it without a Python-side copy and
+        # getvalue() hands back the bytes zero-copy
+        sink = pa.BufferOutputStream()
+        self._serialize_data(processed, sink, fmt)
+        body = sink.getvalue()
         meta = metadata or {}
         meta.update({
             'source': self.source,
             'layer': self.layer,
             'processing_date': processing_date.isoformat(),
-            'checksum': checksum,
+            # content hash of the frame, independent of serialization bytes
+            'checksum': fingerprint,
+            'checksum_algo': CHECKSUM_ALGO,
+            'checksum_kind': 'phash',
             'format': fmt,
             'rows': str(len(processed)),
-            'columns': ','.join(processed.columns),
         })
-        self.s3.upload_fileobj(Fileobj=buf, Bucket=self.bucket, Key=key, ExtraArgs={'Metadata': meta})
+        extra_args = {'Metadata': meta}
+        if fmt.lower() in GZIP_FORMATS:
+            extra_args['ContentType'] = 'application/gzip'
+        if not self._put_if_absent(body, key, extra_args):
+            logger.info(f"Skipping existing object {key}")
+            return key
+        if self.dedup_content:
+            self.s3.put_object(
+                Bucket=self.bucket, Key=self._fingerprint_key(key, fingerprint),
+                Body=b'', Metadata={'key': key}
+            )
         logger.info(f"Ingested to s3://{self.bucket}/{key}")
         return key
 
+    def _put_if_absent(self, body: pa.Buffer, key: str, extra_args: Dict) -> bool:
+        """Upload unless the key exists; False if it was already there"""
+        if body.size < TRANSFER_CONFIG.multipart_threshold:
+            # single conditional PUT: S3 rejects it with 412 if the key exists
+            try:
+                self.s3.put_object(
+                    Bucket=self.bucket, Key=key, Body=pa.BufferReader(body),
+                    IfNoneMatch='*', **extra_args
+                )
+            except ClientError as e:
+                if e.response['Error']['Code'] in ('PreconditionFailed', '412'):
+                    self._remember(key)
+                    return False
+                raise
+            self._remember(key)
+            return True
+        uploaded = self._multipart_put_if_absent(body, key, extra_args)
+        self._remember(key)
+        return uploaded
+
+    def _multipart_put_if_absent(self, body: pa.Buffer, key: str, extra_args: Dict) -> bool:
+        """Multipart upload whose completion is conditional on the key being absent.
+
+        s3transfer's managed upload cannot pass IfNoneMatch, so parts are
+        uploaded concurrently here and CompleteMultipartUpload carries it.
+        """
+        # CRC32 part checksums, as s3transfer requests them
+        upload_id = self.s3.create_multipart_upload(
+            Bucket=self.bucket, Key=key, ChecksumAlgorithm='CRC32', **extra_args
+        )['UploadId']
+        chunksize = TRANSFER_CONFIG.multipart_chunksize
+
+        def upload_part(number: int) -> Dict:
+            offset = (number - 1) * chunksize
+            part = body.slice(offset, min(chunksize, body.size - offset))
+            resp = self.s3.upload_part(
+                Bucket=self.bucket, Key=key, UploadId=upload_id, PartNumber=number,
+                Body=pa.BufferReader(part),
+                ChecksumAlgorithm='CRC32'
+            )
+            return {'PartNumber': number, 'ETag': resp['ETag'],
+                    'ChecksumCRC32': resp['ChecksumCRC32']}
+
+        try:
+            count = -(-body.size // chunksize)
+            with ThreadPoolExecutor(max_workers=min(TRANSFER_CONFIG.max_concurrency, count)) as ex:
+                parts = list(ex.map(upload_part, range(1, count + 1)))
+            self.s3.complete_multipart_upload(
+                Bucket=self.bucket, Key=key, UploadId=upload_id,
+                MultipartUpload={'Parts': parts}, IfNoneMatch='*'
+            )
+        except BaseException as e:
+            self.s3.abort_multipart_upload(Bucket=self.bucket, Key=key, UploadId=upload_id)
+            if isinstance(e, ClientError) and e.response['Error']['Code'] in ('PreconditionFailed', '412'):
+                return False
+            raise
+        return True
+
+    def _fingerprint(self, df: pd.DataFrame, fmt: str) -> str:
+        """Content hash of a frame (format, column names/dtypes, row values)
+        computed from pandas' vectorized row hashes, without serializing"""
+        h = hashlib.new(CHECKSUM_ALGO)
+        h.update(fmt.lower().encode())
+        h.update(','.join(f"{c}:{t}" for c, t in df.dtypes.items()).encode())
+        try:
+            row_hashes = pd.util.hash_pandas_object(df, index=False)
+        except TypeError:
+            # dicts/lists (nested JSON lines, Parquet list columns) are
+            # unhashable; hash the string form of object columns instead
+            nested = df.select_dtypes(include='object').columns
+            row_hashes = pd.util.hash_pandas_object(
+                df.astype({c: str for c in nested}), index=False
+            )
+        h.update(row_hashes.to_numpy())
+        return h.hexdigest()
+
+    def _fingerprint_key(self, key: str, fingerprint: str) -> str:
+        """Sentinel key recording which object in key's partition holds a
+        fingerprint's content.
+
+        Scoped to the partition so the same content ingested for another
+        date still lands in that date's partition, and kept under its own
+        root so layer listings never page through sentinels.
+        """
+        return f"_fingerprints/{key.rpartition('/')[0]}/{fingerprint}"
+
+    def _fingerprint_target(self, key: str, fingerprint: str) -> Optional[str]:
+        """Key in key's partition previously ingested with this fingerprint,
+        if it still exists"""
+        try:
+            head = self.s3.head_object(
+                Bucket=self.bucket, Key=self._fingerprint_key(key, fingerprint)
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == '404':
+                return None
+            raise
+        target = head['Metadata'].get('key')
+        # a deleted target must not block re-ingesting its content
+        return target if target and self._object_exists(target) else None
+
+    def _read_object(
+        self, key: str, fmt: str, columns: Optional[List[str]],
+        filters: Optional[List], sql: Optional[str]
+    ) -> Optional[pa.Table]:
+        """Read one previous-layer object; None if it vanished after listing"""
+        try:
+            if sql:
+                return self._select(key, fmt, sql)
+            if fmt == 'parquet':
+                return self._read_parquet(key, columns, filters)
+            if fmt == 'arrow':
+                return self._read_arrow(key, columns)
+            if fmt == 'csv':
+                return pacsv.read_csv(
+                    self._open_body(key),
+                    convert_options=pacsv.ConvertOptions(include_columns=columns)
+                )
+            if fmt == 'json':
+                table = pajson.read_json(self._open_body(key))
+                return table.select(columns) if columns else table
+        except FileNotFoundError:
+            logger.warning(f"Skipping {key}: removed after listing")
+        return None
+
+    def _list_keys(
+        self, prefix: str, sub_prefixes: Optional[List[str]] = None
+    ) -> List[str]:
+        """List all keys under prefix, paginating sub-prefix shards concurrently.
+
+        Without explicit ``sub_prefixes`` the partition levels under
+        ``prefix`` are discovered down to ``day=`` and used as shards. A
+        single shard is listed flat, without a thread pool.
+        """
+        if sub_prefixes:
+            shards, keys = [prefix + p for p in sub_prefixes], []
+        else:
+            shards, keys = self._discover_shards(prefix)
+        if len(shards) < 2:
+            return keys + [k for shard in shards for k in self._paginate_keys(shard)]
+        with ThreadPoolExecutor(max_workers=min(LIST_WORKERS, len(shards))) as ex:
+            for shard in ex.map(self._paginate_keys, shards):
+                keys.extend(shard)
+        return keys
+
+    def _discover_shards(self, prefix: str):
+        """Walk up to LIST_SHARD_DEPTH partition levels under prefix, one
+        concurrent Delimiter listing per level: (unlisted shard prefixes,
+        keys found on the way)"""
+        shards, keys = [prefix], []
+        for _ in range(LIST_SHARD_DEPTH):
+            if len(shards) == 1:
+                levels = [self._list_level(shards[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=min(LIST_WORKERS, len(shards))) as ex:
+                    levels = list(ex.map(self._list_level, shards))
+            children = []
+            for shard, (sub, level_keys) in zip(shards, levels):
+                children.extend(shard + c for c in sub)
+                keys.extend(level_keys)
+            shards = children
+            if not shards or len(shards) >= LIST_WORKERS:
+                break
+        return shards, keys
+
+    def _list_level(self, prefix: str):
+        """List one level under prefix: (child prefixes relative to prefix, keys).
+
+        ``_``-prefixed children (e.g. ``_fingerprints/``) hold bookkeeping, not data.
+        """
+        pages = self.list_paginator.paginate(
+            Bucket=self.bucket, Prefix=prefix, Delimiter='/',
+            PaginationConfig={'PageSize': 1000}
+        )
+        children, keys = [], []
+        for page in pages:
+            children.extend(
+                child for child in
+                (p['Prefix'][len(prefix):] for p in page.get('CommonPrefixes', []))
+                if not child.startswith('_')
+            )
+            keys.extend(obj['Key'] for obj in page.get('Contents', []))
+        return children, keys
+
+    def _paginate_keys(self, prefix: str) -> List[str]:
+        """List every key under a single prefix"""
+        pages = self.list_paginator.paginate(
+            Bucket=self.bucket, Prefix=prefix,
+            PaginationConfig={'PageSize': 1000}
+        )
+        return [obj['Key'] for page in pages for obj in page.get('Contents', [])]
+
+    def _read_parquet(
+        self, key: str, columns: Optional[List[str]] = None,
+        filters: Optional[List] = None
+    ) -> pa.Table:
+        """Read a Parquet object through Arrow's S3 filesystem (range GETs)"""
+        return pq.read_table(
+            f"{self.bucket}/{key}", filesystem=self.fs,
+            columns=columns, filters=filters, pre_buffer=True
+        )
+
+    def _read_arrow(self, key: str, columns: Optional[List[str]] = None) -> pa.Table:
+        """Read an Arrow IPC stream object through Arrow's S3 filesystem"""
+        with self.fs.open_input_stream(f"{self.bucket}/{key}") as source:
+            table = pa.ipc.open_stream(source).read_all()
+        return table.select(columns) if columns else table
+
+    def _select(self, key: str, fmt: str, sql: str) -> Optional[pa.Table]:
+        """Run an S3 Select query on one object, returning only matching rows"""
+        if fmt == 'parquet':
+            input_serialization = {'Parquet': {}}
+        elif fmt in SELECT_FORMATS:
+            if fmt == 'json':
+                input_serialization = {'JSON': {'Type': 'LINES'}}
+            else:
+                input_serialization = {'CSV': {'FileHeaderInfo': 'USE'}}
+            input_serialization['CompressionType'] = 'GZIP' if key.endswith('.gz') else 'NONE'
+        else:
+            raise ValueError(f"S3 Select does not support format: {fmt}")
+        try:
+            resp = self.s3.select_object_content(
+                Bucket=self.bucket, Key=key,
+                ExpressionType='SQL', Expression=sql,
+                InputSerialization=input_serialization,
+                OutputSerialization={'JSON': {'RecordDelimiter': '\n'}}
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('NoSuchKey', '404'):
+                raise FileNotFoundError(f"s3://{self.bucket}/{key}") from e
+            raise
+        payload = b''.join(
+            event['Records']['Payload'] for event in resp['Payload'] if 'Records' in event
+        )
+        if not payload:
+            return None
+        return pajson.read_json(pa.py_buffer(payload))
+
+    def _open_body(self, key: str) -> pa.NativeFile:
+        """Object bytes as an Arrow stream, gunzipped for ".gz" keys"""
+        return pa.input_stream(
+            pa.py_buffer(self._get_object_body(key)),
+            compression='gzip' if key.endswith('.gz') else None
+        )
+
+    def _get_object_body(self, key: str) -> bytes:
+        """Fetch object bytes, mapping a missing key to FileNotFoundError"""
+        try:
+            return self.s3.get_object(Bucket=self.bucket, Key=key)['Body'].read()
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('NoSuchKey', '404'):
+                raise FileNotFoundError(f"s3://{self.bucket}/{key}") from e
+            raise
+
+    def objects_exist(self, prefix: str, keys: List[str]) -> set:
+        """Subset of keys present under prefix, from one paginated listing.
+
+        The listing is kept for LISTING_TTL seconds, so a batch of existence
+        checks under ``prefix`` costs one LIST rather than a HEAD per key.
+        """
+        listed = set(self._paginate_keys(prefix))
+        with self._listings_lock:
+            self._listings[prefix] = (time.monotonic() + LISTING_TTL, listed)
+            self._listings.move_to_end(prefix)
+            if len(self._listings) > LISTING_CACHE_SIZE:
+                self._listings.popitem(last=False)
+        return listed & set(keys)
+
+    def _cached_listing(self, key: str) -> Optional[set]:
+        """Unexpired listing whose prefix covers key, if any"""
+        now = time.monotonic()
+        with self._listings_lock:
+            for prefix, (expires, listed) in list(self._listings.items()):
+                if expires <= now:
+                    del self._listings[prefix]
+                elif key.startswith(prefix):
+                    self._listings.move_to_end(prefix)
+                    return listed
+        return None
+
+    def _remember(self, key: str):
+        """Record a key we just wrote in the cached listing covering it"""
+        listed = self._cached_listing(key)
+        if listed is not None:
+            listed.add(key)
+
     def _object_exists(self, key: str) -> bool:
-        """Check if object exists in S3"""
+        """Check if object exists in S3, from a fresh cached listing when one covers it"""
+        listed = self._cached_listing(key)
+        if listed is not None:
+            return key in listed
         try:
             self.s3.head_object(Bucket=self.bucket, Key=key)
             return True
@@ -160,7 +675,7 @@ class DataLakeManager:
             raise
 
 class RawLayerManager(DataLakeManager):
-    """Raw layer: store data exactly as received."""
+    """Raw layer: store data as received (CSV is transcoded to Parquet on ingest)."""
     def __init__(self, source: str):
         super().__init__(source, DataLakeLayer.RAW)
 
@@ -172,26 +687,76 @@ class RawLayerManager(DataLakeManager):
         self, df: pd.DataFrame, processing_date: datetime,
         fmt: str, partition_cols: Optional[Dict[str, str]] = None,
         metadata: Optional[Dict[str, str]] = None,
-        source_key: Optional[str] = None
+        source_key: Optional[str] = None,
+        part: Optional[int] = None,
+        stem: Optional[str] = None
     ) -> str:
         # For raw, preserve original bytes if source_key provided
         if source_key and fmt.lower() == 'parquet':
-            raw_obj = self.s3.get_object(Bucket=self.bucket, Key=source_key)['Body'].read()
-            key = self._generate_key(fmt, processing_date, partition_cols)
+            key = self._generate_key(fmt, processing_date, partition_cols, part, stem)
             meta = metadata or {}
             meta.update({'source': self.source, 'layer': self.layer, 'format': fmt})
-            self.s3.put_object(Bucket=self.bucket, Key=key, Body=raw_obj, Metadata=meta)
+            self._copy_object(source_key, key, meta)
             logger.info(f"Raw parquet preserved to s3://{self.bucket}/{key}")
             return key
         # fallback to DataFrame serialization
-        return super().ingest_data(df, processing_date, fmt, partition_cols, metadata)
+        return super().ingest_data(
+            df, processing_date, fmt, partition_cols, metadata, part, stem
+        )
+
+    def _copy_object(self, source_key: str, key: str, meta: Dict[str, str]):
+        """Server-side copy within the bucket; the bytes never leave S3"""
+        copy_source = {'Bucket': self.bucket, 'Key': source_key}
+        try:
+            size = self.s3.head_object(Bucket=self.bucket, Key=source_key)['ContentLength']
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('NoSuchKey', '404'):
+                raise FileNotFoundError(f"s3://{self.bucket}/{source_key}") from e
+            raise
+        if size <= COPY_OBJECT_MAX_SIZE:
+            self.s3.copy_object(
+                Bucket=self.bucket, Key=key, CopySource=copy_source,
+                Metadata=meta, MetadataDirective='REPLACE'
+            )
+        else:
+            # the managed copy switches to multipart UploadPartCopy
+            self.s3.copy(
+                copy_source, self.bucket, key,
+                ExtraArgs={'Metadata': meta, 'MetadataDirective': 'REPLACE'},
+                Config=TRANSFER_CONFIG
+            )
+
+    def ingest_file(
+        self, path: str, processing_date: datetime,
+        partition_cols: Optional[Dict[str, str]] = None,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Upload a local file byte-for-byte, streaming it from disk"""
+        stem, ext = os.path.splitext(os.path.basename(path))
+        fmt = ext.lstrip('.').lower()
+        key = self._generate_key(fmt, processing_date, partition_cols, stem=stem)
+        if self._object_exists(key):
+            logger.info(f"Skipping existing object {key}")
+            return key
+        meta = metadata or {}
+        meta.update({'source': self.source, 'layer': self.layer, 'format': fmt})
+        self.s3.upload_file(
+            Filename=path, Bucket=self.bucket, Key=key,
+            ExtraArgs={'Metadata': meta}, Config=TRANSFER_CONFIG
+        )
+        self._remember(key)
+        logger.info(f"Raw file preserved to s3://{self.bucket}/{key}")
+        return key
 
 class BronzeLayerManager(DataLakeManager):
-    def __init__(self, source: str):
+    def __init__(self, source: str, narrow_dtypes: bool = NARROW_DTYPES):
         super().__init__(source, DataLakeLayer.BRONZE)
+        self.narrow_dtypes = narrow_dtypes
 
     def _process_data(self, df: pd.DataFrame) -> pd.DataFrame:
-        return df
+        if not self.narrow_dtypes:
+            return df
+        return _narrow_dtypes(df, NARROW_COLUMN_TYPES.get(self.source, {}))
 
 class SilverLayerManager(DataLakeManager):
     def __init__(
@@ -223,13 +788,25 @@ def process_layer(layer: str, source: str, processing_date: datetime, transform_
             man.ingest_data(df, processing_date)
         return True
     except Exception as e:
-        logger.error(f"Error processing {layer}: {e}")
+        logger.error(f"Error processing {layer} for {source}: {e}")
         return False
 
+def process_layers(
+    layer: str, sources: List[str], processing_date: datetime,
+    transform_fn: Optional[Callable] = None
+) -> bool:
+    """Run process_layer for several sources concurrently; True if all succeed"""
+    with ThreadPoolExecutor(max_workers=max(1, min(SOURCE_WORKERS, len(sources)))) as pool:
+        results = list(pool.map(
+            lambda source: process_layer(layer, source, processing_date, transform_fn),
+            sources
+        ))
+    return all(results)
+
 
 def main():
     parser = argparse.ArgumentParser(description='Data Lake Pipeline')
-    parser.add_argument('--source', required=True)
+    parser.add_argument('--source', required=True, nargs='+')
     parser.add_argument(
         '--layer', required=True,
         choices=[DataLakeLayer.RAW, DataLakeLayer.BRONZE, DataLakeLayer.SILVER]
@@ -238,8 +815,8 @@ def main():
     args = parser.parse_args()
 
     date = datetime.strptime(args.date, '%Y-%m-%d') if args.date else datetime.now() - timedelta(days=1)
-    logger.info(f"Starting {args.layer} for {args.source} on {date:%Y-%m-%d}")
-    ok = process_layer(args.layer, args.source, date)
+    logger.info(f"Starting {args.layer} for {', '.join(args.source)} on {date:%Y-%m-%d}")
+    ok = process_layers(args.layer, args.source, date)
     return 0 if ok else 1
 
 if __name__ == '__main__':